@@ -0,0 +1,207 @@
+/**
+ * @jest-environment node
+ */
+import { POST } from '@/app/api/admin/scraper-network/callback/route';
+import { NextRequest } from 'next/server';
+import { validateRunnerAuth } from '@/lib/scraper-auth';
+import { createClient } from '@supabase/supabase-js';
+
+jest.mock('@/lib/scraper-auth', () => ({
+    validateRunnerAuth: jest.fn(),
+}));
+
+jest.mock('@supabase/supabase-js', () => ({
+    createClient: jest.fn(),
+}));
+
+const TEST_RUN_ID = '6f1c2e1a-4d0b-4f7e-9a53-0c8d2b7e5a11';
+
+describe('POST /api/admin/scraper-network/callback', () => {
+    let mockSupabase: any;
+
+    beforeEach(() => {
+        process.env.NEXT_PUBLIC_SUPABASE_URL = 'http://localhost:54321';
+        process.env.SUPABASE_SERVICE_ROLE_KEY = 'test-key';
+        jest.clearAllMocks();
+        jest.spyOn(console, 'error').mockImplementation(() => {});
+
+        mockSupabase = {
+            rpc: jest.fn().mockResolvedValue({ data: 'scraper-123', error: null }),
+            from: jest.fn().mockReturnThis(),
+            update: jest.fn().mockReturnThis(),
+            eq: jest.fn().mockResolvedValue({ error: null }),
+        };
+        (createClient as jest.Mock).mockReturnValue(mockSupabase);
+        (validateRunnerAuth as jest.Mock).mockResolvedValue({
+            runnerName: 'test-runner',
+            authMethod: 'api_key',
+        });
+    });
+
+    afterEach(() => {
+        jest.restoreAllMocks();
+    });
+
+    const createRequest = (body: any, headers: Record<string, string> = { 'X-API-Key': 'bsr_test-key' }) => {
+        const reqHeaders = new Map(Object.entries(headers));
+
+        return {
+            headers: {
+                get: (key: string) => reqHeaders.get(key) || null,
+            },
+            json: async () => body,
+        } as unknown as NextRequest;
+    };
+
+    const rpcArgs = () => mockSupabase.rpc.mock.calls[0][1];
+
+    it('should return 401 if authentication fails', async () => {
+        (validateRunnerAuth as jest.Mock).mockResolvedValue(null);
+
+        const res = await POST(createRequest({ job_id: TEST_RUN_ID, status: 'success', results: [] }, {}));
+
+        expect(res.status).toBe(401);
+        expect(mockSupabase.rpc).not.toHaveBeenCalled();
+    });
+
+    it('should return 400 if job_id is missing', async () => {
+        const res = await POST(createRequest({ status: 'success', results: [] }));
+
+        expect(res.status).toBe(400);
+        expect(mockSupabase.rpc).not.toHaveBeenCalled();
+    });
+
+    it('should record the run and attribute it to the runner', async () => {
+        const results = [{ sku: 'SKU-1', status: 'success' }];
+        const res = await POST(createRequest({
+            job_id: TEST_RUN_ID,
+            status: 'success',
+            results,
+            duration_ms: 1200,
+        }));
+
+        expect(res.status).toBe(200);
+        expect(mockSupabase.rpc).toHaveBeenCalledWith('record_scraper_test_result', {
+            p_test_run_id: TEST_RUN_ID,
+            p_status: 'passed',
+            p_results: results,
+            p_error_message: null,
+            p_duration_ms: 1200,
+            p_runner_name: 'test-runner',
+        });
+        expect(mockSupabase.from).toHaveBeenCalledWith('scraper_runners');
+        expect(mockSupabase.eq).toHaveBeenCalledWith('name', 'test-runner');
+    });
+
+    it('should accept a callback without results', async () => {
+        const res = await POST(createRequest({ job_id: TEST_RUN_ID, status: 'success' }));
+
+        expect(res.status).toBe(200);
+        expect(rpcArgs().p_status).toBe('passed');
+        expect(rpcArgs().p_results).toBeNull();
+    });
+
+    it('should return 404 if the test run does not exist', async () => {
+        mockSupabase.rpc.mockResolvedValue({ data: null, error: null });
+
+        const res = await POST(createRequest({ job_id: TEST_RUN_ID, status: 'success', results: [] }));
+
+        expect(res.status).toBe(404);
+        const data = await res.json();
+        expect(data.error).toBe('Test run not found');
+        expect(mockSupabase.update).not.toHaveBeenCalled();
+    });
+
+    it('should return 404 if job_id is not a valid uuid', async () => {
+        mockSupabase.rpc.mockResolvedValue({
+            data: null,
+            error: { code: '22P02', message: 'invalid input syntax for type uuid: "not-a-uuid"' },
+        });
+
+        const res = await POST(createRequest({ job_id: 'not-a-uuid', status: 'success', results: [] }));
+
+        expect(res.status).toBe(404);
+        const data = await res.json();
+        expect(data.error).toBe('Test run not found');
+    });
+
+    it('should return 500 on other database errors', async () => {
+        mockSupabase.rpc.mockResolvedValue({ data: null, error: { code: '57014', message: 'timeout' } });
+
+        const res = await POST(createRequest({ job_id: TEST_RUN_ID, status: 'success', results: [] }));
+
+        expect(res.status).toBe(500);
+        const data = await res.json();
+        expect(data.error).toBe('Failed to update test run');
+    });
+
+    it('should still succeed if the runner heartbeat fails', async () => {
+        mockSupabase.eq.mockResolvedValue({ error: { message: 'DB Error' } });
+
+        const res = await POST(createRequest({ job_id: TEST_RUN_ID, status: 'success', results: [] }));
+
+        expect(res.status).toBe(200);
+        expect(console.error).toHaveBeenCalledWith(
+            '[Callback] Failed to update runner status:',
+            { message: 'DB Error' }
+        );
+    });
+
+    describe('status mapping', () => {
+        it.each([
+            ['success', 'passed'],
+            ['partial', 'partial'],
+            ['failed', 'failed'],
+            ['timeout', 'failed'],
+        ])('should store runner status %s as %s', async (status, expected) => {
+            const res = await POST(createRequest({ job_id: TEST_RUN_ID, status, results: [] }));
+
+            expect(res.status).toBe(200);
+            expect(rpcArgs().p_status).toBe(expected);
+            const data = await res.json();
+            expect(data.final_status).toBe(expected);
+        });
+
+        it('should store unknown statuses as failed', async () => {
+            await POST(createRequest({ job_id: TEST_RUN_ID, status: 'exploded', results: [] }));
+
+            expect(rpcArgs().p_status).toBe('failed');
+        });
+
+        it('should treat no_results SKUs as passing', async () => {
+            await POST(createRequest({
+                job_id: TEST_RUN_ID,
+                status: 'success',
+                results: [
+                    { sku: 'SKU-1', status: 'success' },
+                    { sku: 'SKU-2', status: 'no_results' },
+                ],
+            }));
+
+            expect(rpcArgs().p_status).toBe('passed');
+        });
+
+        it.each(['error', 'timeout'])('should downgrade success to partial when a SKU reports %s', async (skuStatus) => {
+            await POST(createRequest({
+                job_id: TEST_RUN_ID,
+                status: 'success',
+                results: [
+                    { sku: 'SKU-1', status: 'success' },
+                    { sku: 'SKU-2', status: skuStatus },
+                ],
+            }));
+
+            expect(rpcArgs().p_status).toBe('partial');
+        });
+
+        it('should not upgrade a failed run when every SKU passed', async () => {
+            await POST(createRequest({
+                job_id: TEST_RUN_ID,
+                status: 'failed',
+                results: [{ sku: 'SKU-1', status: 'success' }],
+            }));
+
+            expect(rpcArgs().p_status).toBe('failed');
+        });
+    });
+});
@@ -0,0 +1,176 @@
+/**
+ * @jest-environment node
+ */
+import { POST } from '@/app/api/admin/scraping/callback/route';
+import { NextRequest, after } from 'next/server';
+import { validateRunnerAuth } from '@/lib/scraper-auth';
+import { createClient } from '@supabase/supabase-js';
+
+jest.mock('next/server', () => ({
+    ...jest.requireActual('next/server'),
+    after: jest.fn(),
+}));
+
+jest.mock('@/lib/scraper-auth', () => ({
+    validateRunnerAuth: jest.fn(),
+}));
+
+jest.mock('@supabase/supabase-js', () => ({
+    createClient: jest.fn(),
+}));
+
+describe('POST /api/admin/scraping/callback', () => {
+    let mockSupabase: any;
+
+    beforeEach(() => {
+        process.env.NEXT_PUBLIC_SUPABASE_URL = 'http://localhost:54321';
+        process.env.SUPABASE_SERVICE_ROLE_KEY = 'test-key';
+        jest.clearAllMocks();
+        jest.spyOn(console, 'log').mockImplementation(() => {});
+        jest.spyOn(console, 'error').mockImplementation(() => {});
+
+        mockSupabase = {
+            from: jest.fn().mockReturnThis(),
+            update: jest.fn().mockReturnThis(),
+            eq: jest.fn().mockResolvedValue({ error: null }),
+            insert: jest.fn().mockResolvedValue({ error: null }),
+            rpc: jest.fn(),
+        };
+        (createClient as jest.Mock).mockReturnValue(mockSupabase);
+        (validateRunnerAuth as jest.Mock).mockResolvedValue({
+            runnerName: 'test-runner',
+            authMethod: 'api_key',
+        });
+    });
+
+    afterEach(() => {
+        jest.restoreAllMocks();
+    });
+
+    const createRequest = (body: any, headers: Record<string, string> = {}) => {
+        const reqHeaders = new Map(Object.entries(headers));
+
+        return {
+            headers: {
+                get: (key: string) => reqHeaders.get(key) || null,
+            },
+            text: async () => JSON.stringify(body),
+        } as unknown as NextRequest;
+    };
+
+    const scrapedData = (count: number) =>
+        Object.fromEntries(
+            Array.from({ length: count }, (_, i) => [`SKU-${i}`, { amazon: { price: i + 1 } }])
+        );
+
+    // Runs the work the route scheduled with after()
+    const runDeferred = async () => {
+        for (const [task] of (after as jest.Mock).mock.calls) {
+            await task();
+        }
+    };
+
+    const jobUpdates = () => mockSupabase.update.mock.calls.map(([data]: [Record<string, unknown>]) => data);
+
+    it('merges scraped data in batches of 100 SKUs', async () => {
+        mockSupabase.rpc.mockImplementation(async (_fn: string, args: { p_rows: unknown[] }) => ({
+            data: args.p_rows.length,
+            error: null,
+        }));
+
+        const req = createRequest({
+            job_id: 'job-123',
+            status: 'completed',
+            results: { data: scrapedData(250) },
+        });
+        const res = await POST(req);
+
+        expect(res.status).toBe(200);
+        expect(after).toHaveBeenCalledTimes(1);
+        expect(mockSupabase.rpc).not.toHaveBeenCalled();
+
+        await runDeferred();
+
+        expect(mockSupabase.rpc).toHaveBeenCalledTimes(3);
+        const batches = mockSupabase.rpc.mock.calls.map(
+            ([fn, args]: [string, { p_rows: { sku: string }[]; p_scraped_at: string }]) => {
+                expect(fn).toBe('merge_scraped_sources');
+                return args;
+            }
+        );
+        expect(batches.map((b: { p_rows: unknown[] }) => b.p_rows.length)).toEqual([100, 100, 50]);
+        expect(batches[0].p_rows[0]).toEqual({ sku: 'SKU-0', sources: { amazon: { price: 1 } } });
+        expect(batches[2].p_rows[49].sku).toBe('SKU-249');
+        // Every batch is stamped with the same scrape time
+        expect(new Set(batches.map((b: { p_scraped_at: string }) => b.p_scraped_at)).size).toBe(1);
+
+        expect(mockSupabase.insert).toHaveBeenCalledWith(expect.objectContaining({
+            job_id: 'job-123',
+            runner_name: 'test-runner',
+        }));
+    });
+
+    it('keeps merging later batches when one batch fails', async () => {
+        mockSupabase.rpc
+            .mockResolvedValueOnce({ data: 100, error: null })
+            .mockResolvedValueOnce({ data: null, error: { message: 'DB Error' } })
+            .mockResolvedValueOnce({ data: 50, error: null });
+
+        const req = createRequest({
+            job_id: 'job-123',
+            status: 'completed',
+            results: { data: scrapedData(250) },
+        });
+        await POST(req);
+        await runDeferred();
+
+        expect(mockSupabase.rpc).toHaveBeenCalledTimes(3);
+        expect(mockSupabase.rpc.mock.calls[2][1].p_rows[0].sku).toBe('SKU-200');
+        expect(mockSupabase.insert).toHaveBeenCalledTimes(1);
+        expect(console.error).toHaveBeenCalledWith(
+            '[Callback] Failed to update products with scraped data:',
+            { message: 'DB Error' }
+        );
+    });
+
+    it('marks a completed job completed only after its results are persisted', async () => {
+        mockSupabase.rpc.mockResolvedValue({ data: 1, error: null });
+
+        const req = createRequest({
+            job_id: 'job-123',
+            status: 'completed',
+            results: { data: scrapedData(1) },
+        });
+        await POST(req);
+
+        expect(jobUpdates()).not.toContainEqual(expect.objectContaining({ status: 'completed' }));
+
+        await runDeferred();
+
+        expect(jobUpdates()).toContainEqual({
+            status: 'completed',
+            completed_at: expect.any(String),
+        });
+        const updateOrder: number[] = mockSupabase.update.mock.invocationCallOrder;
+        const completeOrder = updateOrder[updateOrder.length - 1];
+        expect(completeOrder).toBeGreaterThan(mockSupabase.rpc.mock.invocationCallOrder[0]);
+        expect(completeOrder).toBeGreaterThan(mockSupabase.insert.mock.invocationCallOrder[0]);
+    });
+
+    it('marks a failed job immediately without persisting results', async () => {
+        const req = createRequest({
+            job_id: 'job-123',
+            status: 'failed',
+            error_message: 'Browser crashed',
+        });
+        const res = await POST(req);
+
+        expect(res.status).toBe(200);
+        expect(after).not.toHaveBeenCalled();
+        expect(jobUpdates()).toContainEqual({
+            status: 'failed',
+            completed_at: expect.any(String),
+            error_message: 'Browser crashed',
+        });
+    });
+});
@@ -1,20 +1,25 @@
 /**
  * @jest-environment node
  */
-import { 
-    validateRunnerJWT, 
-    validateAPIKey, 
-    validateHMAC, 
-    validateRunnerAuth,
-    generateAPIKey 
-} from '@/lib/scraper-auth';
-import { createClient } from '@supabase/supabase-js';
+import type { createClient } from '@supabase/supabase-js';
 
 jest.mock('@supabase/supabase-js', () => ({
     createClient: jest.fn(),
 }));
 
-const mockCreateClient = createClient as jest.MockedFunction<typeof createClient>;
+const mockRpc = jest.fn();
+
+// scraper-auth keeps module-level state (the cached admin client), so each
+// test loads a fresh copy together with the supabase-js mock it sees
+let scraperAuth: typeof import('@/lib/scraper-auth');
+let mockCreateClient: jest.MockedFunction<typeof createClient>;
+
+function loadScraperAuth() {
+    jest.isolateModules(() => {
+        mockCreateClient = require('@supabase/supabase-js').createClient;
+        scraperAuth = require('@/lib/scraper-auth');
+    });
+}
 
 describe('scraper-auth', () => {
     const originalEnv = process.env;
@@ -28,6 +33,8 @@ describe('scraper-auth', () => {
             SUPABASE_SERVICE_ROLE_KEY: 'test-service-key',
             SCRAPER_WEBHOOK_SECRET: 'test-webhook-secret',
         };
+        loadScraperAuth();
+        mockCreateClient.mockReturnValue({ rpc: mockRpc } as never);
     });
 
     afterEach(() => {
@@ -36,7 +43,7 @@ describe('scraper-auth', () => {
 
     describe('generateAPIKey', () => {
         it('generates a key with correct format', () => {
-            const { key, hash, prefix } = generateAPIKey();
+            const { key, hash, prefix } = scraperAuth.generateAPIKey();
             
             expect(key).toMatch(/^bsr_[A-Za-z0-9_-]+$/);
             expect(hash).toMatch(/^[a-f0-9]{64}$/);
@@ -44,8 +51,8 @@ describe('scraper-auth', () => {
         });
 
         it('generates unique keys', () => {
-            const key1 = generateAPIKey();
-            const key2 = generateAPIKey();
+            const key1 = scraperAuth.generateAPIKey();
+            const key2 = scraperAuth.generateAPIKey();
             
             expect(key1.key).not.toBe(key2.key);
             expect(key1.hash).not.toBe(key2.hash);
@@ -54,24 +61,22 @@ describe('scraper-auth', () => {
 
     describe('validateAPIKey', () => {
         it('returns null for null key', async () => {
-            const result = await validateAPIKey(null);
+            const result = await scraperAuth.validateAPIKey(null);
             expect(result).toBeNull();
         });
 
         it('returns null for key without bsr_ prefix', async () => {
-            const result = await validateAPIKey('invalid-key');
+            const result = await scraperAuth.validateAPIKey('invalid-key');
             expect(result).toBeNull();
         });
 
         it('returns runner info for valid key', async () => {
-            const mockRpc = jest.fn().mockResolvedValue({
+            mockRpc.mockResolvedValue({
                 data: [{ runner_name: 'test-runner', key_id: 'key-123', is_valid: true }],
                 error: null,
             });
 
-            mockCreateClient.mockReturnValue({ rpc: mockRpc } as never);
-
-            const result = await validateAPIKey('bsr_valid-test-key');
+            const result = await scraperAuth.validateAPIKey('bsr_valid-test-key');
 
             expect(result).toEqual({
                 runnerName: 'test-runner',
@@ -81,27 +86,38 @@ describe('scraper-auth', () => {
         });
 
         it('returns null for invalid key', async () => {
-            const mockRpc = jest.fn().mockResolvedValue({
+            mockRpc.mockResolvedValue({
                 data: [{ is_valid: false }],
                 error: null,
             });
 
-            mockCreateClient.mockReturnValue({ rpc: mockRpc } as never);
-
-            const result = await validateAPIKey('bsr_invalid-key');
+            const result = await scraperAuth.validateAPIKey('bsr_invalid-key');
             expect(result).toBeNull();
         });
+
+        it('reuses the admin client across validations', async () => {
+            mockRpc.mockResolvedValue({
+                data: [{ is_valid: false }],
+                error: null,
+            });
+
+            await scraperAuth.validateAPIKey('bsr_first-key');
+            await scraperAuth.validateAPIKey('bsr_second-key');
+
+            expect(mockRpc).toHaveBeenCalledTimes(2);
+            expect(mockCreateClient).toHaveBeenCalledTimes(1);
+        });
     });
 
     describe('validateHMAC', () => {
         it('returns null for null signature', async () => {
-            const result = await validateHMAC('payload', null);
+            const result = await scraperAuth.validateHMAC('payload', null);
             expect(result).toBeNull();
         });
 
         it('returns null when secret is not configured', async () => {
             delete process.env.SCRAPER_WEBHOOK_SECRET;
-            const result = await validateHMAC('payload', 'signature');
+            const result = await scraperAuth.validateHMAC('payload', 'signature');
             expect(result).toBeNull();
         });
 
@@ -113,7 +129,7 @@ describe('scraper-auth', () => {
                 .update(payload)
                 .digest('hex');
 
-            const result = await validateHMAC(payload, signature, 'my-runner');
+            const result = await scraperAuth.validateHMAC(payload, signature, 'my-runner');
 
             expect(result).toEqual({
                 runnerName: 'my-runner',
@@ -122,24 +138,24 @@ describe('scraper-auth', () => {
         });
 
         it('returns null for invalid signature', async () => {
-            const result = await validateHMAC('payload', 'invalid-signature', 'runner');
+            const result = await scraperAuth.validateHMAC('payload', 'invalid-signature', 'runner');
             expect(result).toBeNull();
         });
     });
 
     describe('validateRunnerJWT (legacy)', () => {
         it('returns null if auth header is missing', async () => {
-            const result = await validateRunnerJWT(null);
+            const result = await scraperAuth.validateRunnerJWT(null);
             expect(result).toBeNull();
         });
 
         it('returns null if auth header is not Bearer format', async () => {
-            const result = await validateRunnerJWT('Basic abc123');
+            const result = await scraperAuth.validateRunnerJWT('Basic abc123');
             expect(result).toBeNull();
         });
 
         it('returns null if token is empty', async () => {
-            const result = await validateRunnerJWT('Bearer ');
+            const result = await scraperAuth.validateRunnerJWT('Bearer ');
             expect(result).toBeNull();
         });
 
@@ -152,7 +168,7 @@ describe('scraper-auth', () => {
 
             mockCreateClient.mockReturnValue({ auth: mockAuth } as never);
 
-            const result = await validateRunnerJWT('Bearer invalid-token');
+            const result = await scraperAuth.validateRunnerJWT('Bearer invalid-token');
             expect(result).toBeNull();
         });
 
@@ -180,7 +196,7 @@ describe('scraper-auth', () => {
                 .mockReturnValueOnce({ auth: mockAuth } as never)
                 .mockReturnValueOnce({ from: mockFrom } as never);
 
-            const result = await validateRunnerJWT('Bearer valid-token');
+            const result = await scraperAuth.validateRunnerJWT('Bearer valid-token');
 
             expect(result).toEqual({
                 runnerName: 'test-runner',
@@ -191,14 +207,12 @@ describe('scraper-auth', () => {
 
     describe('validateRunnerAuth', () => {
         it('prefers API key over other methods', async () => {
-            const mockRpc = jest.fn().mockResolvedValue({
+            mockRpc.mockResolvedValue({
                 data: [{ runner_name: 'api-key-runner', key_id: 'key-123', is_valid: true }],
                 error: null,
             });
 
-            mockCreateClient.mockReturnValue({ rpc: mockRpc } as never);
-
-            const result = await validateRunnerAuth({
+            const result = await scraperAuth.validateRunnerAuth({
                 apiKey: 'bsr_valid-key',
                 authorization: 'Bearer jwt-token',
             });
@@ -215,7 +229,7 @@ describe('scraper-auth', () => {
                 .update(payload)
                 .digest('hex');
 
-            const result = await validateRunnerAuth(
+            const result = await scraperAuth.validateRunnerAuth(
                 { webhookSignature: signature },
                 payload,
                 'hmac-runner'
@@ -225,7 +239,7 @@ describe('scraper-auth', () => {
         });
 
         it('returns null if all methods fail', async () => {
-            const result = await validateRunnerAuth({});
+            const result = await scraperAuth.validateRunnerAuth({});
             expect(result).toBeNull();
         });
     });
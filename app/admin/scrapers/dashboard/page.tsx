@@ -10,29 +10,30 @@ export const metadata: Metadata = {
 export default async function ScraperDashboardPage() {
   const supabase = await createClient();
 
-  const { data: scrapers } = await supabase
-    .from('scrapers')
-    .select('id, name, display_name, status, health_status, health_score, last_test_at')
-    .order('name');
+  const [{ data: scrapers }, { data: recentTests }] = await Promise.all([
+    supabase
+      .from('scrapers')
+      .select('id, name, display_name, status, health_status, health_score, last_test_at')
+      .order('name'),
+    supabase
+      .from('scraper_test_runs')
+      .select('*')
+      .order('created_at', { ascending: false })
+      .limit(50),
+  ]);
 
-  const { data: recentTests } = await supabase
-    .from('scraper_test_runs')
-    .select('*')
-    .order('created_at', { ascending: false })
-    .limit(50);
+  const healthCounts = { healthy: 0, degraded: 0, broken: 0, unknown: 0 };
+  const statusCounts = { active: 0, draft: 0, disabled: 0 };
 
-  const healthCounts = {
-    healthy: scrapers?.filter((s) => s.health_status === 'healthy').length || 0,
-    degraded: scrapers?.filter((s) => s.health_status === 'degraded').length || 0,
-    broken: scrapers?.filter((s) => s.health_status === 'broken').length || 0,
-    unknown: scrapers?.filter((s) => s.health_status === 'unknown').length || 0,
-  };
-
-  const statusCounts = {
-    active: scrapers?.filter((s) => s.status === 'active').length || 0,
-    draft: scrapers?.filter((s) => s.status === 'draft').length || 0,
-    disabled: scrapers?.filter((s) => s.status === 'disabled').length || 0,
-  };
+  // Tally both breakdowns in one pass over the scraper list
+  for (const s of scrapers || []) {
+    if (s.health_status in healthCounts) {
+      healthCounts[s.health_status as keyof typeof healthCounts]++;
+    }
+    if (s.status in statusCounts) {
+      statusCounts[s.status as keyof typeof statusCounts]++;
+    }
+  }
 
   return (
     <ScraperDashboardClient
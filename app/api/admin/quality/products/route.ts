@@ -45,6 +45,20 @@ const QUALITY_RULES = [
   },
 ];
 
+// Issue objects are identical for every product failing a rule, so build them once.
+// Frozen because every matching product shares them until the response is serialized.
+const QUALITY_CHECKS = QUALITY_RULES.map((rule) => ({
+  check: rule.check,
+  issue: Object.freeze({
+    field: rule.field,
+    severity: rule.severity,
+    message: rule.message,
+  }),
+}));
+
+// Fields counted towards completeness
+const COMPLETENESS_FIELDS = ['name', 'price', 'description', 'images', 'brand_id'] as const;
+
 function calculateCompleteness(consolidated: Record<string, unknown> | null): number {
   if (!consolidated) return 0;
   
@@ -60,7 +74,7 @@ function calculateCompleteness(consolidated: Record<string, unknown> | null): nu
   if (Array.isArray(consolidated.images) && consolidated.images.length > 0) completed++;
   if (consolidated.brand_id) completed++;
   
-  return Math.round((completed / QUALITY_RULES.length) * 100);
+  return Math.round((completed / COMPLETENESS_FIELDS.length) * 100);
 }
 
 export async function GET(request: Request) {
@@ -79,35 +93,33 @@ export async function GET(request: Request) {
       return NextResponse.json({ error: error.message }, { status: 500 });
     }
     
-    const productsWithIssues: ProductIssue[] = (products || [])
-      .map((p) => {
-        const consolidated = (p.consolidated || {}) as Record<string, unknown>;
-        const input = (p.input || {}) as Record<string, unknown>;
-        
-        const issues = QUALITY_RULES
-          .filter((rule) => rule.check(consolidated))
-          .map((rule) => ({
-            field: rule.field,
-            severity: rule.severity,
-            message: rule.message,
-          }));
-        
-        return {
-          sku: p.sku,
-          name: (consolidated.name || input.name || null) as string | null,
-          completeness: calculateCompleteness(consolidated),
-          issues,
-          pipeline_status: p.pipeline_status,
-        };
-      })
-      .filter((p) => {
-        if (p.issues.length === 0) return false;
-        if (severityFilter) {
-          return p.issues.some((i) => i.severity === severityFilter);
+    const productsWithIssues: ProductIssue[] = [];
+    
+    // Validate and filter in one pass; completeness is only computed for products kept
+    for (const p of products || []) {
+      const consolidated = (p.consolidated || {}) as Record<string, unknown>;
+      
+      const issues: ProductIssue['issues'] = [];
+      for (const { check, issue } of QUALITY_CHECKS) {
+        if (check(consolidated)) {
+          issues.push(issue);
         }
-        return true;
-      })
-      .sort((a, b) => a.completeness - b.completeness);
+      }
+      
+      if (issues.length === 0) continue;
+      if (severityFilter && !issues.some((i) => i.severity === severityFilter)) continue;
+      
+      const input = (p.input || {}) as Record<string, unknown>;
+      productsWithIssues.push({
+        sku: p.sku,
+        name: (consolidated.name || input.name || null) as string | null,
+        completeness: calculateCompleteness(consolidated),
+        issues,
+        pipeline_status: p.pipeline_status,
+      });
+    }
+    
+    productsWithIssues.sort((a, b) => a.completeness - b.completeness);
     
     return NextResponse.json({ products: productsWithIssues });
   } catch (err) {
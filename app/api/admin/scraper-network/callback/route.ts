@@ -1,13 +1,22 @@
 import { NextRequest, NextResponse } from 'next/server';
-import { createClient } from '@/lib/supabase/server';
-import crypto from 'crypto';
+import { createClient, SupabaseClient } from '@supabase/supabase-js';
+import { validateRunnerAuth } from '@/lib/scraper-auth';
 
 export const dynamic = 'force-dynamic';
 
+function getSupabaseAdmin(): SupabaseClient {
+  const url = process.env.NEXT_PUBLIC_SUPABASE_URL;
+  const key = process.env.SUPABASE_SERVICE_ROLE_KEY;
+  if (!url || !key) {
+    throw new Error('Missing Supabase configuration');
+  }
+  return createClient(url, key);
+}
+
 interface CallbackPayload {
   job_id: string;
   status: 'success' | 'partial' | 'failed' | 'timeout';
-  results: Array<{
+  results?: Array<{
     sku: string;
     status: 'success' | 'no_results' | 'error' | 'timeout';
     data?: Record<string, unknown>;
@@ -19,46 +28,33 @@ interface CallbackPayload {
   runner_id?: string;
 }
 
-async function validateApiKey(request: NextRequest): Promise<{ valid: boolean; runnerId?: string }> {
-  const apiKey = request.headers.get('X-API-Key');
-  
-  if (!apiKey || !apiKey.startsWith('bsr_')) {
-    return { valid: false };
-  }
-
-  const supabase = await createClient();
-  
-  const keyHash = crypto.createHash('sha256').update(apiKey).digest('hex');
-  
-  const { data: runner, error } = await supabase
-    .from('scraper_runners')
-    .select('id, status')
-    .eq('api_key_hash', keyHash)
-    .single();
-
-  if (error || !runner) {
-    return { valid: false };
-  }
+type TestRunStatus = 'passed' | 'failed' | 'partial';
 
-  if (runner.status === 'revoked') {
-    return { valid: false };
-  }
+// Runner-reported job status -> stored test run status
+const FINAL_STATUS: Record<CallbackPayload['status'], TestRunStatus> = {
+  success: 'passed',
+  partial: 'partial',
+  failed: 'failed',
+  timeout: 'failed',
+};
 
-  return { valid: true, runnerId: runner.id };
-}
+// Per-SKU outcomes that don't downgrade a successful run to partial
+const PASSING_RESULT_STATUSES: ReadonlySet<string> = new Set(['success', 'no_results']);
 
 export async function POST(request: NextRequest) {
   try {
-    const auth = await validateApiKey(request);
+    const runner = await validateRunnerAuth({
+      apiKey: request.headers.get('X-API-Key'),
+    });
     
-    if (!auth.valid) {
+    if (!runner) {
       return NextResponse.json(
         { error: 'Invalid or missing API key' },
         { status: 401 }
       );
     }
 
-    const supabase = await createClient();
+    const supabase = getSupabaseAdmin();
     const body: CallbackPayload = await request.json();
 
     const { job_id, status, results, error_message, duration_ms } = body;
@@ -70,40 +66,29 @@ export async function POST(request: NextRequest) {
       );
     }
 
-    const { data: testRun, error: fetchError } = await supabase
-      .from('scraper_test_runs')
-      .select('*')
-      .eq('id', job_id)
-      .single();
+    let finalStatus = FINAL_STATUS[status] ?? 'failed';
+    if (finalStatus === 'passed' && !(results ?? []).every(r => PASSING_RESULT_STATUSES.has(r.status))) {
+      finalStatus = 'partial';
+    }
 
-    if (fetchError || !testRun) {
+    // Stores the run and recalculates scraper health in one transaction
+    const { data: scraperId, error: updateError } = await supabase.rpc('record_scraper_test_result', {
+      p_test_run_id: job_id,
+      p_status: finalStatus,
+      p_results: results ?? null,
+      p_error_message: error_message ?? null,
+      p_duration_ms: duration_ms ?? null,
+      p_runner_name: runner.runnerName,
+    });
+
+    // A job_id that isn't a valid uuid can't match any test run
+    if (updateError?.code === '22P02') {
       return NextResponse.json(
         { error: 'Test run not found' },
         { status: 404 }
       );
     }
 
-    let finalStatus: 'passed' | 'failed' | 'partial' = 'failed';
-    
-    if (status === 'success') {
-      const allSuccess = results.every(r => r.status === 'success' || r.status === 'no_results');
-      finalStatus = allSuccess ? 'passed' : 'partial';
-    } else if (status === 'partial') {
-      finalStatus = 'partial';
-    }
-
-    const { error: updateError } = await supabase
-      .from('scraper_test_runs')
-      .update({
-        status: finalStatus,
-        results,
-        error_message,
-        duration_ms,
-        completed_at: new Date().toISOString(),
-        runner_id: auth.runnerId,
-      })
-      .eq('id', job_id);
-
     if (updateError) {
       console.error('[Callback] Failed to update test run:', updateError);
       return NextResponse.json(
@@ -112,16 +97,24 @@ export async function POST(request: NextRequest) {
       );
     }
 
-    await updateScraperHealth(supabase, testRun.scraper_id);
+    if (!scraperId) {
+      return NextResponse.json(
+        { error: 'Test run not found' },
+        { status: 404 }
+      );
+    }
 
-    if (auth.runnerId) {
-      await supabase
-        .from('scraper_runners')
-        .update({
-          last_seen_at: new Date().toISOString(),
-          status: 'online',
-        })
-        .eq('id', auth.runnerId);
+    const { error: heartbeatError } = await supabase
+      .from('scraper_runners')
+      .update({
+        last_seen_at: new Date().toISOString(),
+        status: 'online',
+      })
+      .eq('name', runner.runnerName);
+
+    if (heartbeatError) {
+      // The result is already stored; a missed heartbeat is corrected by the next request
+      console.error('[Callback] Failed to update runner status:', heartbeatError);
     }
 
     return NextResponse.json({
@@ -139,38 +132,3 @@ export async function POST(request: NextRequest) {
     );
   }
 }
-
-async function updateScraperHealth(
-  supabase: Awaited<ReturnType<typeof createClient>>,
-  scraperId: string
-) {
-  const { data: recentTests } = await supabase
-    .from('scraper_test_runs')
-    .select('status')
-    .eq('scraper_id', scraperId)
-    .order('created_at', { ascending: false })
-    .limit(10);
-
-  if (!recentTests || recentTests.length === 0) return;
-
-  const passedCount = recentTests.filter(t => t.status === 'passed').length;
-  const partialCount = recentTests.filter(t => t.status === 'partial').length;
-  
-  const healthScore = Math.round(
-    ((passedCount + partialCount * 0.5) / recentTests.length) * 100
-  );
-
-  let healthStatus: 'healthy' | 'degraded' | 'broken' | 'unknown' = 'unknown';
-  if (healthScore >= 80) healthStatus = 'healthy';
-  else if (healthScore >= 50) healthStatus = 'degraded';
-  else if (healthScore > 0) healthStatus = 'broken';
-
-  await supabase
-    .from('scrapers')
-    .update({
-      health_score: healthScore,
-      health_status: healthStatus,
-      last_test_at: new Date().toISOString(),
-    })
-    .eq('id', scraperId);
-}
@@ -1,4 +1,4 @@
-import { NextRequest, NextResponse } from 'next/server';
+import { NextRequest, NextResponse, after } from 'next/server';
 import { createClient, SupabaseClient } from '@supabase/supabase-js';
 import { validateRunnerAuth } from '@/lib/scraper-auth';
 
@@ -11,6 +11,9 @@ function getSupabaseAdmin(): SupabaseClient {
     return createClient(url, key);
 }
 
+// Max SKUs per merge_scraped_sources call when persisting results
+const PERSIST_BATCH_SIZE = 100;
+
 interface ScrapedData {
     [scraperName: string]: {
         price?: number;
@@ -77,30 +80,40 @@ export async function POST(request: NextRequest) {
 
         const supabase = getSupabaseAdmin();
 
+        const { results } = payload;
+
+        // A completed job with results is marked completed by persistScrapeResults once
+        // its data is stored, so nothing reads it as completed before the merge lands
+        const deferCompletion = payload.status === 'completed' && !!results;
+
         // Update job status
-        const updateData: Record<string, unknown> = {
-            status: payload.status,
-        };
+        const updateData: Record<string, unknown> = {};
 
-        if (payload.status === 'completed' || payload.status === 'failed') {
-            updateData.completed_at = new Date().toISOString();
+        if (!deferCompletion) {
+            updateData.status = payload.status;
+
+            if (payload.status === 'completed' || payload.status === 'failed') {
+                updateData.completed_at = new Date().toISOString();
+            }
         }
 
         if (payload.error_message) {
             updateData.error_message = payload.error_message;
         }
 
-        const { error: updateError } = await supabase
-            .from('scrape_jobs')
-            .update(updateData)
-            .eq('id', payload.job_id);
-
-        if (updateError) {
-            console.error('[Callback] Failed to update job:', updateError);
-            return NextResponse.json(
-                { error: 'Failed to update job' },
-                { status: 500 }
-            );
+        if (Object.keys(updateData).length > 0) {
+            const { error: updateError } = await supabase
+                .from('scrape_jobs')
+                .update(updateData)
+                .eq('id', payload.job_id);
+
+            if (updateError) {
+                console.error('[Callback] Failed to update job:', updateError);
+                return NextResponse.json(
+                    { error: 'Failed to update job' },
+                    { status: 500 }
+                );
+            }
         }
 
         // Update runner status
@@ -121,56 +134,9 @@ export async function POST(request: NextRequest) {
             })
             .eq('name', runnerName);
 
-        // Process scraped data if job completed successfully
-        if (payload.status === 'completed' && payload.results?.data) {
-            const skus = Object.keys(payload.results.data);
-
-            for (const sku of skus) {
-                const scrapedData = payload.results.data[sku];
-
-                const { data: product } = await supabase
-                    .from('products_ingestion')
-                    .select('sources')
-                    .eq('sku', sku)
-                    .single();
-
-                const existingSources = (product?.sources as Record<string, unknown>) || {};
-                const updatedSources = {
-                    ...existingSources,
-                    ...scrapedData,
-                    _last_scraped: new Date().toISOString(),
-                };
-
-                const { error: productError } = await supabase
-                    .from('products_ingestion')
-                    .update({
-                        sources: updatedSources,
-                        pipeline_status: 'scraped',
-                        updated_at: new Date().toISOString(),
-                    })
-                    .eq('sku', sku);
-
-                if (productError) {
-                    console.error(`[Callback] Failed to update product ${sku}:`, productError);
-                }
-            }
-
-            console.log(`[Callback] Updated ${skus.length} products with scraped data`);
-        }
-
-        // Store full results for audit/debugging
-        if (payload.status === 'completed' && payload.results) {
-            const { error: insertError } = await supabase
-                .from('scrape_results')
-                .insert({
-                    job_id: payload.job_id,
-                    runner_name: runnerName,
-                    data: payload.results,
-                });
-
-            if (insertError) {
-                console.error('[Callback] Failed to insert results:', insertError);
-            }
+        // Persist scraped data after responding so the runner isn't held up by per-SKU writes
+        if (payload.status === 'completed' && results) {
+            after(() => persistScrapeResults(supabase, payload.job_id, results, runnerName));
         }
 
         console.log(`[Callback] Job ${payload.job_id} updated to ${payload.status} by ${runnerName}`);
@@ -184,3 +150,70 @@ export async function POST(request: NextRequest) {
         );
     }
 }
+
+/**
+ * Merges scraped data into products_ingestion, stores the raw payload for
+ * audit/debugging, then marks the job completed. Runs after the callback has
+ * responded.
+ */
+async function persistScrapeResults(
+    supabase: SupabaseClient,
+    jobId: string,
+    results: NonNullable<CallbackPayload['results']>,
+    runnerName: string
+) {
+    try {
+        const scraped = results.data;
+
+        if (scraped) {
+            const skus = Object.keys(scraped);
+            const scrapedAt = new Date().toISOString();
+            let updatedCount = 0;
+
+            // Keep each RPC body bounded on large jobs
+            for (let i = 0; i < skus.length; i += PERSIST_BATCH_SIZE) {
+                const rows = skus
+                    .slice(i, i + PERSIST_BATCH_SIZE)
+                    .map(sku => ({ sku, sources: scraped[sku] }));
+
+                // Merges into existing sources server-side; SKUs not in products_ingestion are skipped
+                const { data: updated, error: mergeError } = await supabase.rpc('merge_scraped_sources', {
+                    p_rows: rows,
+                    p_scraped_at: scrapedAt,
+                });
+
+                if (mergeError) {
+                    console.error('[Callback] Failed to update products with scraped data:', mergeError);
+                    continue;
+                }
+
+                updatedCount += updated || 0;
+            }
+
+            console.log(`[Callback] Updated ${updatedCount} products with scraped data`);
+        }
+
+        // Store full results for audit/debugging
+        const { error: insertError } = await supabase
+            .from('scrape_results')
+            .insert({
+                job_id: jobId,
+                runner_name: runnerName,
+                data: results,
+            });
+
+        if (insertError) {
+            console.error('[Callback] Failed to insert results:', insertError);
+        }
+    } finally {
+        // Completed even if some writes failed (they're logged above), so the job never stays running
+        const { error: completeError } = await supabase
+            .from('scrape_jobs')
+            .update({ status: 'completed', completed_at: new Date().toISOString() })
+            .eq('id', jobId);
+
+        if (completeError) {
+            console.error('[Callback] Failed to mark job completed:', completeError);
+        }
+    }
+}
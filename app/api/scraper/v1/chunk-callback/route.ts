@@ -57,6 +57,7 @@ export async function POST(request: NextRequest) {
         }
 
         const supabase = getSupabaseAdmin();
+        const now = new Date().toISOString();
 
         // Get chunk details first
         const { data: chunk, error: chunkError } = await supabase
@@ -76,8 +77,8 @@ export async function POST(request: NextRequest) {
         // Update chunk status and results
         const updateData: Record<string, unknown> = {
             status,
-            completed_at: new Date().toISOString(),
-            updated_at: new Date().toISOString(),
+            completed_at: now,
+            updated_at: now,
         };
 
         if (results) {
@@ -110,43 +111,49 @@ export async function POST(request: NextRequest) {
         const jobId = chunk.job_id;
         const { data: chunkStats, error: statsError } = await supabase
             .from('scrape_job_chunks')
-            .select('status')
+            .select('status, skus_processed, skus_successful, skus_failed')
             .eq('job_id', jobId);
 
         if (!statsError && chunkStats) {
+            // Tally chunk states and SKU counters in a single pass
             const totalChunks = chunkStats.length;
-            const completedChunks = chunkStats.filter(c => c.status === 'completed').length;
-            const failedChunks = chunkStats.filter(c => c.status === 'failed').length;
-            const pendingOrRunning = chunkStats.filter(c => 
-                c.status === 'pending' || c.status === 'claimed' || c.status === 'running'
-            ).length;
+            let completedChunks = 0;
+            let failedChunks = 0;
+            let pendingOrRunning = 0;
+            let skusProcessed = 0;
+            let skusSuccessful = 0;
+            let skusFailed = 0;
+
+            for (const c of chunkStats) {
+                if (c.status === 'completed') completedChunks++;
+                else if (c.status === 'failed') failedChunks++;
+                else if (c.status === 'pending' || c.status === 'claimed' || c.status === 'running') pendingOrRunning++;
+
+                skusProcessed += c.skus_processed || 0;
+                skusSuccessful += c.skus_successful || 0;
+                skusFailed += c.skus_failed || 0;
+            }
 
             console.log(`[Chunk Callback] Job ${jobId} progress: ${completedChunks + failedChunks}/${totalChunks} chunks done (${pendingOrRunning} in progress)`);
 
             // If all chunks are complete (success or failure), update job status
             if (pendingOrRunning === 0) {
                 const jobStatus = failedChunks > 0 && completedChunks === 0 ? 'failed' : 'completed';
-                
-                // Aggregate results from all chunks
-                const { data: allChunks } = await supabase
-                    .from('scrape_job_chunks')
-                    .select('results, skus_processed, skus_successful, skus_failed')
-                    .eq('job_id', jobId);
 
                 const aggregatedResults = {
                     chunks_total: totalChunks,
                     chunks_completed: completedChunks,
                     chunks_failed: failedChunks,
-                    skus_processed: allChunks?.reduce((sum, c) => sum + (c.skus_processed || 0), 0) || 0,
-                    skus_successful: allChunks?.reduce((sum, c) => sum + (c.skus_successful || 0), 0) || 0,
-                    skus_failed: allChunks?.reduce((sum, c) => sum + (c.skus_failed || 0), 0) || 0,
+                    skus_processed: skusProcessed,
+                    skus_successful: skusSuccessful,
+                    skus_failed: skusFailed,
                 };
 
                 await supabase
                     .from('scrape_jobs')
                     .update({
                         status: jobStatus,
-                        completed_at: new Date().toISOString(),
+                        completed_at: now,
                     })
                     .eq('id', jobId);
 
@@ -154,13 +161,14 @@ export async function POST(request: NextRequest) {
             }
         }
 
-        // Update runner status to online (not busy)
+        // Update runner status to online (not busy) before responding; the runner
+        // claims its next chunk as soon as it hears back, so this must land first
         const runnerName = runner.runnerName;
         await supabase
             .from('scraper_runners')
             .update({
                 status: 'online',
-                last_seen_at: new Date().toISOString(),
+                last_seen_at: now,
             })
             .eq('name', runnerName);
 
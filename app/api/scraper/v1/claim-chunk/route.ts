@@ -64,6 +64,7 @@ export async function POST(request: NextRequest) {
         // Use provided runner_name or fall back to authenticated runner name
         const claimingRunner = runner_name || runner.runnerName;
         const supabase = getSupabaseAdmin();
+        const now = new Date().toISOString();
 
         // Call the atomic claim function
         const { data: claimedChunks, error: claimError } = await supabase.rpc('claim_next_chunk', {
@@ -106,8 +107,8 @@ export async function POST(request: NextRequest) {
             .from('scrape_job_chunks')
             .update({ 
                 status: 'running',
-                started_at: new Date().toISOString(),
-                updated_at: new Date().toISOString(),
+                started_at: now,
+                updated_at: now,
             })
             .eq('id', chunk.chunk_id);
 
@@ -116,7 +117,7 @@ export async function POST(request: NextRequest) {
             .from('scraper_runners')
             .update({
                 status: 'busy',
-                last_seen_at: new Date().toISOString(),
+                last_seen_at: now,
             })
             .eq('name', claimingRunner);
 
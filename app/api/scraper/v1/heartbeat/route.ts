@@ -37,9 +37,10 @@ export async function POST(request: NextRequest) {
         // Always use the authenticated runner name, ignoring what the runner claims in the body
         const runnerName = runner.runnerName;
         const supabase = getSupabaseAdmin();
+        const now = new Date().toISOString();
 
         const updatePayload: Record<string, unknown> = {
-            last_seen_at: new Date().toISOString(),
+            last_seen_at: now,
             status: body.status || 'idle',
         };
 
@@ -68,7 +69,7 @@ export async function POST(request: NextRequest) {
 
         return NextResponse.json({
             acknowledged: true,
-            timestamp: new Date().toISOString(),
+            timestamp: now,
         });
     } catch (error) {
         console.error('[Heartbeat] Error:', error);
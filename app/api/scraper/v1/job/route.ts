@@ -84,7 +84,23 @@ export async function GET(request: NextRequest) {
             scraperQuery = scraperQuery.in('name', job.scrapers);
         }
 
-        const { data: scrapers, error: scrapersError } = await scraperQuery;
+        // SKUs come from the job or default to staging products; that lookup
+        // doesn't depend on the scraper configs, so run both queries together
+        const jobSkus: string[] = job.skus || [];
+        const [{ data: scrapers, error: scrapersError }, stagingResult] = await Promise.all([
+            scraperQuery,
+            jobSkus.length === 0
+                ? supabase
+                    .from('products')
+                    .select('sku')
+                    .eq('pipeline_status', 'staging')
+                    .limit(500)
+                : null,
+        ]);
+
+        const skus: string[] = stagingResult?.data
+            ? stagingResult.data.map(p => p.sku)
+            : jobSkus;
 
         if (scrapersError) {
             console.error(`[Scraper API] Failed to fetch scrapers:`, scrapersError);
@@ -94,20 +110,6 @@ export async function GET(request: NextRequest) {
             );
         }
 
-        // Get SKUs (from job or default to staging products)
-        let skus: string[] = job.skus || [];
-        if (skus.length === 0) {
-            const { data: stagingProducts } = await supabase
-                .from('products')
-                .select('sku')
-                .eq('pipeline_status', 'staging')
-                .limit(500);
-
-            if (stagingProducts) {
-                skus = stagingProducts.map(p => p.sku);
-            }
-        }
-
         const response: JobConfigResponse = {
             job_id: job.id,
             skus,
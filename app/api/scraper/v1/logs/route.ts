@@ -52,12 +52,13 @@ export async function POST(request: NextRequest) {
         }
 
         const supabase = getSupabaseAdmin();
+        const now = new Date().toISOString();
 
         const logsToInsert = logs.map(log => ({
             job_id,
             level: log.level,
             message: log.message,
-            created_at: log.timestamp || new Date().toISOString(),
+            created_at: log.timestamp || now,
         }));
 
         const { error } = await supabase
@@ -48,11 +48,12 @@ export async function POST(request: NextRequest) {
         const body = await request.json();
         const runnerName = runner.runnerName;
         const supabase = getSupabaseAdmin();
+        const now = new Date().toISOString();
 
         await supabase
             .from('scraper_runners')
             .update({
-                last_seen_at: new Date().toISOString(),
+                last_seen_at: now,
                 status: 'polling',
             })
             .eq('name', runnerName);
@@ -81,8 +82,8 @@ export async function POST(request: NextRequest) {
             .update({
                 status: 'claimed',
                 runner_name: runnerName,
-                started_at: new Date().toISOString(),
-                updated_at: new Date().toISOString(),
+                started_at: now,
+                updated_at: now,
             })
             .eq('id', job.job_id);
 
@@ -95,20 +96,23 @@ export async function POST(request: NextRequest) {
             scraperQuery = scraperQuery.in('name', job.scrapers);
         }
 
-        const { data: scrapers } = await scraperQuery;
-
-        let skus: string[] = job.skus || [];
-        if (skus.length === 0) {
-            const { data: stagingProducts } = await supabase
-                .from('products')
-                .select('sku')
-                .eq('pipeline_status', 'staging')
-                .limit(500);
-
-            if (stagingProducts) {
-                skus = stagingProducts.map(p => p.sku);
-            }
-        }
+        // SKUs come from the job or default to staging products; that lookup
+        // doesn't depend on the scraper configs, so run both queries together
+        const jobSkus: string[] = job.skus || [];
+        const [{ data: scrapers }, stagingResult] = await Promise.all([
+            scraperQuery,
+            jobSkus.length === 0
+                ? supabase
+                    .from('products')
+                    .select('sku')
+                    .eq('pipeline_status', 'staging')
+                    .limit(500)
+                : null,
+        ]);
+
+        const skus: string[] = stagingResult?.data
+            ? stagingResult.data.map(p => p.sku)
+            : jobSkus;
 
         console.log(`[Poll] Runner ${runnerName} claimed job ${job.job_id}: ${skus.length} SKUs, ${scrapers?.length || 0} scrapers`);
 
@@ -1,6 +1,6 @@
 'use client';
 
-import { useState, useCallback, useTransition, useEffect } from 'react';
+import { useState, useCallback, useTransition, useEffect, useRef } from 'react';
 import { useRouter } from 'next/navigation';
 import Link from 'next/link';
 import dynamic from 'next/dynamic';
@@ -50,6 +50,12 @@ interface ScraperEditorClientProps {
   scraper: ScraperRecord;
 }
 
+interface YamlValidation {
+  valid: boolean;
+  config?: ScraperConfig;
+  error?: string;
+}
+
 export function ScraperEditorClient({ scraper }: ScraperEditorClientProps) {
   const router = useRouter();
   const [isPending, startTransition] = useTransition();
@@ -76,18 +82,30 @@ export function ScraperEditorClient({ scraper }: ScraperEditorClientProps) {
 
 
 
-  const validateYaml = useCallback((content: string): { valid: boolean; config?: ScraperConfig; error?: string } => {
+  // Save re-validates the content the editor just validated, so keep the last result
+  const lastValidationRef = useRef<{ content: string; result: YamlValidation } | null>(null);
+
+  const validateYaml = useCallback((content: string): YamlValidation => {
+    if (lastValidationRef.current?.content === content) {
+      return lastValidationRef.current.result;
+    }
+
+    let validation: YamlValidation;
     try {
       const parsed = parse(content);
       const result = scraperConfigSchema.safeParse(parsed);
       if (result.success) {
-        return { valid: true, config: result.data as ScraperConfig };
+        validation = { valid: true, config: result.data as ScraperConfig };
+      } else {
+        const firstError = result.error.issues[0];
+        validation = { valid: false, error: `${firstError.path.join('.')}: ${firstError.message}` };
       }
-      const firstError = result.error.issues[0];
-      return { valid: false, error: `${firstError.path.join('.')}: ${firstError.message}` };
     } catch (err) {
-      return { valid: false, error: err instanceof Error ? err.message : 'Invalid YAML syntax' };
+      validation = { valid: false, error: err instanceof Error ? err.message : 'Invalid YAML syntax' };
     }
+
+    lastValidationRef.current = { content, result: validation };
+    return validation;
   }, []);
 
   const handleEditorChange = useCallback((value: string | undefined) => {
@@ -24,6 +24,12 @@ interface LogViewerProps {
     className?: string;
 }
 
+// Realtime inserts are buffered and flushed at most this often (~10 Hz)
+const LOG_FLUSH_INTERVAL_MS = 100;
+
+// Oldest lines are dropped past this so long-running jobs don't grow the DOM unbounded
+const MAX_LOG_ENTRIES = 1000;
+
 export function LogViewer({ jobId, initialLogs = [], className }: LogViewerProps) {
     const [logs, setLogs] = useState<LogEntry[]>(initialLogs);
     const [autoScroll, setAutoScroll] = useState(true);
@@ -38,11 +44,12 @@ export function LogViewer({ jobId, initialLogs = [], className }: LogViewerProps
                 .from('scrape_job_logs')
                 .select('*')
                 .eq('job_id', jobId)
-                .order('created_at', { ascending: true })
-                .limit(1000);
+                .order('created_at', { ascending: false })
+                .limit(MAX_LOG_ENTRIES);
             
             if (!error && data) {
-                setLogs(data);
+                // Newest entries were fetched first; display them oldest-to-newest
+                setLogs(data.reverse());
             }
         };
         
@@ -50,6 +57,20 @@ export function LogViewer({ jobId, initialLogs = [], className }: LogViewerProps
             fetchLogs();
         }
 
+        // Batch incoming rows so a chatty runner doesn't trigger a render per log line
+        let pendingLogs: LogEntry[] = [];
+        let flushTimer: ReturnType<typeof setTimeout> | null = null;
+
+        const flushPendingLogs = () => {
+            flushTimer = null;
+            const batch = pendingLogs;
+            pendingLogs = [];
+            setLogs((prev) => {
+                const next = [...prev, ...batch];
+                return next.length > MAX_LOG_ENTRIES ? next.slice(-MAX_LOG_ENTRIES) : next;
+            });
+        };
+
         // Subscribe to real-time changes
         const channel = supabase
             .channel(`logs-${jobId}`)
@@ -62,8 +83,10 @@ export function LogViewer({ jobId, initialLogs = [], className }: LogViewerProps
                     filter: `job_id=eq.${jobId}`,
                 },
                 (payload) => {
-                    const newLog = payload.new as LogEntry;
-                    setLogs((prev) => [...prev, newLog]);
+                    pendingLogs.push(payload.new as LogEntry);
+                    if (flushTimer === null) {
+                        flushTimer = setTimeout(flushPendingLogs, LOG_FLUSH_INTERVAL_MS);
+                    }
                 }
             )
             .subscribe((status) => {
@@ -71,6 +94,9 @@ export function LogViewer({ jobId, initialLogs = [], className }: LogViewerProps
             });
 
         return () => {
+            if (flushTimer !== null) {
+                clearTimeout(flushTimer);
+            }
             supabase.removeChannel(channel);
         };
     }, [jobId, supabase]);
@@ -1,6 +1,6 @@
 'use client';
 
-import { useEffect, useCallback } from 'react';
+import { useEffect, useCallback, useRef } from 'react';
 import { createBrowserClient } from '@supabase/ssr';
 import type { RealtimePostgresChangesPayload } from '@supabase/supabase-js';
 
@@ -12,6 +12,9 @@ type ProductIngestionRow = {
   updated_at: string;
 };
 
+// Bursts of row updates (e.g. several scrapers finishing together) collapse into one refresh
+const UPDATE_THROTTLE_MS = 250;
+
 interface UseEnrichmentRealtimeOptions {
   sku: string;
   onUpdate: () => void;
@@ -22,10 +25,15 @@ export function useEnrichmentRealtime({ sku, onUpdate, enabled = true }: UseEnri
   const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL;
   const supabaseAnonKey = process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY;
 
+  const updateTimerRef = useRef<ReturnType<typeof setTimeout> | null>(null);
+
   const handleChange = useCallback(
     (payload: RealtimePostgresChangesPayload<ProductIngestionRow>) => {
-      if (payload.eventType === 'UPDATE' && payload.new?.sku === sku) {
-        onUpdate();
+      if (payload.eventType === 'UPDATE' && payload.new?.sku === sku && updateTimerRef.current === null) {
+        updateTimerRef.current = setTimeout(() => {
+          updateTimerRef.current = null;
+          onUpdate();
+        }, UPDATE_THROTTLE_MS);
       }
     },
     [sku, onUpdate]
@@ -51,6 +59,10 @@ export function useEnrichmentRealtime({ sku, onUpdate, enabled = true }: UseEnri
       .subscribe();
 
     return () => {
+      if (updateTimerRef.current !== null) {
+        clearTimeout(updateTimerRef.current);
+        updateTimerRef.current = null;
+      }
       supabase.removeChannel(channel);
     };
   }, [sku, enabled, supabaseUrl, supabaseAnonKey, handleChange]);
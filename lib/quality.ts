@@ -67,11 +67,28 @@ const qualityRules: Array<{
         },
     ];
 
+/**
+ * Issue objects are identical for every product that fails a rule, so build
+ * them once. Frozen because they are shared across results.
+ */
+const qualityChecks = qualityRules.map((rule) => ({
+    check: rule.check,
+    issue: Object.freeze<QualityIssue>({
+        field: rule.field,
+        severity: rule.severity,
+        message: rule.message,
+    }),
+}));
+
+/**
+ * Fields counted towards completeness.
+ */
+const completenessFields = ['name', 'price', 'description', 'images', 'brand_id'] as const;
+
 /**
  * Calculates completeness percentage for a product.
  */
 function calculateCompleteness(product: PipelineProduct): number {
-    const fields = ['name', 'price', 'description', 'images', 'brand_id'];
     let completed = 0;
 
     const name = product.consolidated?.name || product.input?.name;
@@ -84,20 +101,20 @@ function calculateCompleteness(product: PipelineProduct): number {
     if (product.consolidated?.images && product.consolidated.images.length > 0) completed++;
     if (product.consolidated?.brand_id) completed++;
 
-    return Math.round((completed / fields.length) * 100);
+    return Math.round((completed / completenessFields.length) * 100);
 }
 
 /**
  * Validates a product and returns its issues.
  */
 export function validateProduct(product: PipelineProduct): QualityIssue[] {
-    return qualityRules
-        .filter((rule) => rule.check(product))
-        .map((rule) => ({
-            field: rule.field,
-            severity: rule.severity,
-            message: rule.message,
-        }));
+    const issues: QualityIssue[] = [];
+    for (const { check, issue } of qualityChecks) {
+        if (check(product)) {
+            issues.push(issue);
+        }
+    }
+    return issues;
 }
 
 /**
@@ -125,21 +142,20 @@ export async function getProductsWithIssues(options?: {
     }
 
     const products = (data as PipelineProduct[]) || [];
-    const productsWithIssues: ProductWithIssues[] = products
-        .map((product) => {
-            const issues = validateProduct(product);
-            const completeness = calculateCompleteness(product);
-            return { product, issues, completeness };
-        })
-        .filter((p) => {
-            if (options?.severityFilter === 'required') {
-                return p.issues.some((i) => i.severity === 'required');
-            }
-            if (options?.severityFilter === 'recommended') {
-                return p.issues.some((i) => i.severity === 'recommended');
-            }
-            return p.issues.length > 0;
-        });
+    const severityFilter = options?.severityFilter;
+    const productsWithIssues: ProductWithIssues[] = [];
+
+    // Validate and filter in one pass; completeness is only computed for products kept
+    for (const product of products) {
+        const issues = validateProduct(product);
+        const matches = severityFilter === 'required' || severityFilter === 'recommended'
+            ? issues.some((i) => i.severity === severityFilter)
+            : issues.length > 0;
+
+        if (matches) {
+            productsWithIssues.push({ product, issues, completeness: calculateCompleteness(product) });
+        }
+    }
 
     return { products: productsWithIssues, count: count || 0 };
 }
@@ -1,4 +1,4 @@
-import { createClient } from '@supabase/supabase-js';
+import { createClient, SupabaseClient } from '@supabase/supabase-js';
 import crypto from 'crypto';
 
 export interface RunnerAuthResult {
@@ -7,13 +7,20 @@ export interface RunnerAuthResult {
     authMethod: 'api_key';
 }
 
-function getSupabaseAdmin() {
+// Reused across requests so auth doesn't build a new client on every runner call
+let supabaseAdmin: SupabaseClient | null = null;
+
+function getSupabaseAdmin(): SupabaseClient {
+    if (supabaseAdmin) {
+        return supabaseAdmin;
+    }
     const url = process.env.NEXT_PUBLIC_SUPABASE_URL;
     const key = process.env.SUPABASE_SERVICE_ROLE_KEY;
     if (!url || !key) {
         throw new Error('Missing Supabase configuration');
     }
-    return createClient(url, key);
+    supabaseAdmin = createClient(url, key);
+    return supabaseAdmin;
 }
 
 /**
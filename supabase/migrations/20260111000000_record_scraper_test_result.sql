@@ -0,0 +1,76 @@
+-- Migration: Record scraper test results and refresh health in one call
+-- Replaces the callback's separate fetch/update/select/update round-trips
+
+create or replace function record_scraper_test_result(
+    p_test_run_id uuid,
+    p_status text,
+    p_results jsonb default null,
+    p_error_message text default null,
+    p_duration_ms int default null,
+    p_runner_name text default null
+)
+returns uuid language plpgsql as $$
+declare
+    v_scraper_id uuid;
+    v_total int;
+    v_passed int;
+    v_partial int;
+    v_score int;
+begin
+    update scraper_test_runs
+    set
+        status = p_status,
+        -- Omitted fields keep their stored values (failed/timed-out callbacks may send no results)
+        results = coalesce(p_results, results),
+        error_message = coalesce(p_error_message, error_message),
+        duration_ms = coalesce(p_duration_ms, duration_ms),
+        runner_name = coalesce(p_runner_name, runner_name),
+        completed_at = now()
+    where id = p_test_run_id
+    returning scraper_id into v_scraper_id;
+
+    if v_scraper_id is null then
+        return null;
+    end if;
+
+    -- Health is based on the 10 most recent runs, partial runs counting half.
+    -- This intentionally differs from calculate_scraper_health(), which scores only
+    -- the latest run's per-SKU test/fake results (70/30). It keeps the run-history
+    -- scoring the callback computed before this function existed, so stored scores
+    -- don't shift when a runner reports results.
+    select
+        count(*),
+        count(*) filter (where recent.status = 'passed'),
+        count(*) filter (where recent.status = 'partial')
+    into v_total, v_passed, v_partial
+    from (
+        select status
+        from scraper_test_runs
+        where scraper_id = v_scraper_id
+        order by created_at desc
+        limit 10
+    ) recent;
+
+    if v_total > 0 then
+        v_score := round(((v_passed + v_partial * 0.5) / v_total) * 100);
+
+        update scrapers
+        set
+            health_score = v_score,
+            health_status = case
+                when v_score >= 80 then 'healthy'
+                when v_score >= 50 then 'degraded'
+                when v_score > 0 then 'broken'
+                else 'unknown'
+            end,
+            last_test_at = now()
+        where id = v_scraper_id;
+    end if;
+
+    return v_scraper_id;
+end;
+$$;
+
+grant execute on function record_scraper_test_result(uuid, text, jsonb, text, int, text) to service_role;
+
+comment on function record_scraper_test_result is 'Stores a completed test run and recalculates the owning scraper''s health in a single transaction. Returns the scraper id, or null if the test run does not exist.';
@@ -0,0 +1,27 @@
+-- Migration: Bulk-merge scraped data into products_ingestion
+-- Lets the scraping callback update many SKUs in one call without a prior read
+
+create or replace function merge_scraped_sources(p_rows jsonb, p_scraped_at text)
+returns int language plpgsql as $$
+declare
+    v_updated int;
+begin
+    -- Update-only: SKUs missing from products_ingestion are ignored, never inserted
+    update products_ingestion pi
+    set
+        sources = coalesce(pi.sources, '{}'::jsonb)
+            || coalesce(r.sources, '{}'::jsonb)
+            || jsonb_build_object('_last_scraped', p_scraped_at),
+        pipeline_status = 'scraped',
+        updated_at = p_scraped_at::timestamptz
+    from jsonb_to_recordset(p_rows) as r(sku text, sources jsonb)
+    where pi.sku = r.sku;
+
+    get diagnostics v_updated = row_count;
+    return v_updated;
+end;
+$$;
+
+grant execute on function merge_scraped_sources(jsonb, text) to service_role;
+
+comment on function merge_scraped_sources is 'Shallow-merges scraped source data ([{sku, sources}]) into existing products_ingestion rows and marks them scraped. Returns the number of rows updated.';